@@ -9,10 +9,22 @@ from .exceptions import (
     YNABRateLimitError,
     YNABValidationError,
 )
-from .server import main
 from .ynab_client import YNABClient
 
 __version__ = "0.1.0"
+
+
+def main() -> None:
+    """Entry point for the MCP server.
+
+    The server module is imported here rather than at package import so that using
+    ``YNABClient`` directly doesn't build the FastMCP tool registry or configure logging.
+    """
+    from .server import main as run_server
+
+    run_server()
+
+
 __all__ = [
     "YNABClient",
     "main",
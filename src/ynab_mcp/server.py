@@ -2,34 +2,57 @@
 
 from __future__ import annotations
 
-import json
+import importlib.util
 import logging
 import os
-from functools import lru_cache
+import sys
+from typing import Any
 
+import anyio
+import orjson
 from dotenv import load_dotenv
 from mcp.server import FastMCP
+from mcp.types import Tool
 
 from .exceptions import YNABValidationError
+from .validation import validate_cleared_status, validate_date, validate_frequency
 from .ynab_client import YNABClient
 
-# Configure logging
-logging.basicConfig(
-    level=os.getenv("LOG_LEVEL", "INFO"),
-    format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
-)
 logger = logging.getLogger(__name__)
 
-# Load environment variables
-load_dotenv()
+
+class YNABMCP(FastMCP):
+    """FastMCP server that builds its tools/list response once.
+
+    FastMCP rebuilds every Tool (including its input/output JSON schemas) on each
+    tools/list request. The tool set here is fixed once this module is imported, so the
+    list is built on the first request and reused until another tool is registered.
+    """
+
+    _tool_list: list[Tool] | None = None
+
+    def add_tool(self, *args: Any, **kwargs: Any) -> None:
+        self._tool_list = None
+        super().add_tool(*args, **kwargs)
+
+    async def list_tools(self) -> list[Tool]:
+        if self._tool_list is None:
+            self._tool_list = await super().list_tools()
+        return self._tool_list
+
 
 # Create MCP server
-mcp = FastMCP("YNAB")
+mcp = YNABMCP("YNAB")
+
+# orjson options for tool responses; main() enables indentation when YNAB_PRETTY_JSON is set
+_json_options = 0
+
+
+_client: YNABClient | None = None
 
 
-@lru_cache(maxsize=1)
 def get_ynab_client() -> YNABClient:
-    """Get or create YNAB client instance (cached singleton).
+    """Get or create the YNAB client instance (module-level singleton).
 
     Returns:
         YNABClient instance
@@ -37,7 +60,11 @@ def get_ynab_client() -> YNABClient:
     Raises:
         YNABValidationError: If YNAB_ACCESS_TOKEN is not set
     """
-    logger.info("Getting YNAB client instance")
+    global _client
+    if _client is not None:
+        return _client
+
+    logger.info("Creating YNAB client instance")
     token = os.getenv("YNAB_ACCESS_TOKEN")
     if not token:
         error_msg = (
@@ -46,7 +73,32 @@ def get_ynab_client() -> YNABClient:
         )
         logger.error(error_msg)
         raise YNABValidationError(error_msg)
-    return YNABClient(token)
+    cache_ttl = os.getenv("YNAB_CACHE_TTL")
+    if cache_ttl is None:
+        _client = YNABClient(token)
+    else:
+        try:
+            _client = YNABClient(token, cache_ttl=float(cache_ttl))
+        except ValueError as e:
+            raise YNABValidationError(
+                f"YNAB_CACHE_TTL must be a number of seconds, got '{cache_ttl}'"
+            ) from e
+    return _client
+
+
+def _to_json(result: object) -> str:
+    """Serialize a tool result for the MCP response.
+
+    Tools must stay ``async def`` (FastMCP only awaits coroutine functions), so they
+    await the client call inline and pass the result straight here.
+
+    Args:
+        result: JSON-serializable tool result
+
+    Returns:
+        Compact JSON string (indented when YNAB_PRETTY_JSON is set)
+    """
+    return orjson.dumps(result, option=_json_options).decode()
 
 
 @mcp.tool()
@@ -60,8 +112,7 @@ async def get_accounts(budget_id: str) -> str:
         JSON string with list of accounts
     """
     client = get_ynab_client()
-    result = await client.get_accounts(budget_id)
-    return json.dumps(result, indent=2)
+    return _to_json(await client.get_accounts(budget_id))
 
 
 @mcp.tool()
@@ -76,8 +127,7 @@ async def get_category(budget_id: str, category_id: str) -> str:
         JSON string with category details including goals, budgeted amounts, activity, and balance
     """
     client = get_ynab_client()
-    result = await client.get_category(budget_id, category_id)
-    return json.dumps(result, indent=2)
+    return _to_json(await client.get_category(budget_id, category_id))
 
 
 @mcp.tool()
@@ -92,8 +142,7 @@ async def get_categories(budget_id: str, include_hidden: bool = False) -> str:
         JSON string with category groups and categories
     """
     client = get_ynab_client()
-    result = await client.get_categories(budget_id, include_hidden)
-    return json.dumps(result, indent=2)
+    return _to_json(await client.get_categories(budget_id, include_hidden))
 
 
 @mcp.tool()
@@ -118,24 +167,60 @@ async def get_underfunded_goals(budget_id: str, month: str) -> str:
         for the month, helping with budget distribution decisions.
     """
     client = get_ynab_client()
-    result = await client.get_underfunded_goals(budget_id, month)
-    return json.dumps(result, indent=2)
+    return _to_json(await client.get_underfunded_goals(budget_id, month))
 
 
 @mcp.tool()
-async def get_budget_summary(budget_id: str, month: str) -> str:
+async def get_budget_summary(budget_id: str, month: str, include_group_names: bool = True) -> str:
     """Get budget summary for a specific month.
 
     Args:
         budget_id: The ID of the budget (use 'last-used' for default budget)
         month: Month in YYYY-MM-DD format (e.g., 2025-01-01 for January 2025)
+        include_group_names: Include each category's group name (default: True). Set to
+            False when only totals are needed; it saves a request.
 
     Returns:
         JSON string with budget summary including income, budgeted amounts, and category details
     """
     client = get_ynab_client()
-    result = await client.get_budget_summary(budget_id, month)
-    return json.dumps(result, indent=2)
+    return _to_json(await client.get_budget_summary(budget_id, month, include_group_names))
+
+
+@mcp.tool()
+async def get_month_dashboard(budget_id: str, month: str) -> str:
+    """Get a month's budget summary and its transactions in a single call.
+
+    Both reads are issued concurrently, which is faster than calling
+    get_budget_summary and then get_transactions for the same month.
+
+    Args:
+        budget_id: The ID of the budget (use 'last-used' for default budget)
+        month: Month in YYYY-MM-DD format (e.g., 2025-01-01 for January 2025)
+
+    Returns:
+        JSON string with the budget summary plus the month's transactions
+    """
+    client = get_ynab_client()
+    return _to_json(await client.get_month_dashboard(budget_id, month))
+
+
+@mcp.tool()
+async def refresh_all(budget_id: str, since_date: str = None) -> str:
+    """Get budgets, categories and recent transactions in a single call.
+
+    The three reads are issued concurrently, which is faster than calling
+    get_categories and get_transactions one after another.
+
+    Args:
+        budget_id: The ID of the budget (use 'last-used' for default budget)
+        since_date: Only include transactions on or after this date (YYYY-MM-DD format)
+
+    Returns:
+        JSON string with budgets, categories and the first page of transactions
+    """
+    client = get_ynab_client()
+    return _to_json(await client.refresh_all(budget_id, since_date))
 
 
 @mcp.tool()
@@ -167,10 +252,11 @@ async def get_transactions(
         compare_spending_by_year instead to avoid timeouts and reduce context usage.
     """
     client = get_ynab_client()
-    result = await client.get_transactions(
-        budget_id, since_date, until_date, account_id, category_id, limit, page
+    return _to_json(
+        await client.get_transactions(
+            budget_id, since_date, until_date, account_id, category_id, limit, page
+        )
     )
-    return json.dumps(result, indent=2)
 
 
 @mcp.tool()
@@ -194,8 +280,9 @@ async def search_transactions(
         JSON string with matching transactions and count
     """
     client = get_ynab_client()
-    result = await client.search_transactions(budget_id, search_term, since_date, until_date, limit)
-    return json.dumps(result, indent=2)
+    return _to_json(
+        await client.search_transactions(budget_id, search_term, since_date, until_date, limit)
+    )
 
 
 @mcp.tool()
@@ -226,11 +313,56 @@ async def create_transaction(
     Returns:
         JSON string with the created transaction
     """
+    # Reject malformed input before making any API request
+    validate_date(date)
+    validate_cleared_status(cleared)
+
     client = get_ynab_client()
-    result = await client.create_transaction(
-        budget_id, account_id, date, amount, payee_name, category_id, memo, cleared, approved
+    return _to_json(
+        await client.create_transaction(
+            budget_id, account_id, date, amount, payee_name, category_id, memo, cleared, approved
+        )
     )
-    return json.dumps(result, indent=2)
+
+
+@mcp.tool()
+async def create_transactions(budget_id: str, transactions: str) -> str:
+    """Create several transactions in a single request.
+
+    Much faster than calling create_transaction repeatedly when importing or
+    entering many transactions at once.
+
+    Args:
+        budget_id: The ID of the budget (use 'last-used' for default budget)
+        transactions: JSON string containing an array of transactions. Each transaction has:
+            - account_id (required): The account ID
+            - date (required): Transaction date in YYYY-MM-DD format
+            - amount (required): Amount (positive for inflow, negative for outflow)
+            - payee_name, category_id, memo (optional)
+            - cleared (optional): 'cleared', 'uncleared', or 'reconciled' (default: 'uncleared')
+            - approved (optional): Whether the transaction is approved (default: False)
+            Example: '[{"account_id": "acct1", "date": "2025-10-01", "amount": -12.50, "payee_name": "Cafe"}]'
+
+    Returns:
+        JSON string with the created transactions, their count, and any duplicate import IDs
+    """
+    # Parse transactions JSON string
+    try:
+        transactions_list = orjson.loads(transactions)
+    except orjson.JSONDecodeError as e:
+        raise YNABValidationError(f"Invalid transactions JSON: {e}") from e
+    if not isinstance(transactions_list, list) or not all(
+        isinstance(transaction, dict) for transaction in transactions_list
+    ):
+        raise YNABValidationError("transactions must be a JSON array of objects")
+
+    # Reject malformed input before making any API request
+    for transaction in transactions_list:
+        validate_date(transaction.get("date"))
+        validate_cleared_status(transaction.get("cleared") or "uncleared")
+
+    client = get_ynab_client()
+    return _to_json(await client.create_transactions(budget_id, transactions_list))
 
 
 @mcp.tool()
@@ -270,20 +402,67 @@ async def update_transaction(
         - Split transaction dates and amounts cannot be modified
         - To create a split transaction, use create_split_transaction instead
     """
+    # Reject malformed input before making any API request
+    if date is not None:
+        validate_date(date)
+    if cleared is not None:
+        validate_cleared_status(cleared)
+
     client = get_ynab_client()
-    result = await client.update_transaction(
-        budget_id,
-        transaction_id,
-        account_id,
-        date,
-        amount,
-        payee_name,
-        category_id,
-        memo,
-        cleared,
-        approved,
+    return _to_json(
+        await client.update_transaction(
+            budget_id,
+            transaction_id,
+            account_id,
+            date,
+            amount,
+            payee_name,
+            category_id,
+            memo,
+            cleared,
+            approved,
+        )
     )
-    return json.dumps(result, indent=2)
+
+
+@mcp.tool()
+async def bulk_update_transactions(budget_id: str, updates: str) -> str:
+    """Update several transactions in a single request.
+
+    Much faster than calling update_transaction repeatedly, e.g. to approve or
+    recategorize everything returned by get_unapproved_transactions.
+
+    Args:
+        budget_id: The ID of the budget (use 'last-used' for default budget)
+        updates: JSON string containing an array of updates. Each update has:
+            - id (required): The transaction ID to update
+            - account_id, date (YYYY-MM-DD), amount, payee_name, category_id, memo (optional)
+            - cleared (optional): 'cleared', 'uncleared', or 'reconciled'
+            - approved (optional): Whether the transaction is approved
+            Fields left out keep their current values.
+            Example: '[{"id": "txn1", "approved": true}, {"id": "txn2", "category_id": "cat1"}]'
+
+    Returns:
+        JSON string with the updated transactions and their count
+    """
+    try:
+        updates_list = orjson.loads(updates)
+    except orjson.JSONDecodeError as e:
+        raise YNABValidationError(f"Invalid updates JSON: {e}") from e
+    if not isinstance(updates_list, list) or not all(
+        isinstance(update, dict) for update in updates_list
+    ):
+        raise YNABValidationError("updates must be a JSON array of objects")
+
+    # Reject malformed input before making any API request
+    for update in updates_list:
+        if update.get("date") is not None:
+            validate_date(update["date"])
+        if update.get("cleared") is not None:
+            validate_cleared_status(update["cleared"])
+
+    client = get_ynab_client()
+    return _to_json(await client.bulk_update_transactions(budget_id, updates_list))
 
 
 @mcp.tool()
@@ -307,10 +486,11 @@ async def get_category_spending_summary(
         JSON string with summary including total spent, average per month, transaction count, monthly breakdown, and optional graph
     """
     client = get_ynab_client()
-    result = await client.get_category_spending_summary(
-        budget_id, category_id, since_date, until_date, include_graph
+    return _to_json(
+        await client.get_category_spending_summary(
+            budget_id, category_id, since_date, until_date, include_graph
+        )
     )
-    return json.dumps(result, indent=2)
 
 
 @mcp.tool()
@@ -334,10 +514,11 @@ async def compare_spending_by_year(
         JSON string with year-over-year comparison including totals, changes, percentage changes, and optional graph
     """
     client = get_ynab_client()
-    result = await client.compare_spending_by_year(
-        budget_id, category_id, start_year, num_years, include_graph
+    return _to_json(
+        await client.compare_spending_by_year(
+            budget_id, category_id, start_year, num_years, include_graph
+        )
     )
-    return json.dumps(result, indent=2)
 
 
 @mcp.tool()
@@ -351,8 +532,7 @@ async def get_scheduled_transactions(budget_id: str) -> str:
         JSON string with list of scheduled transactions
     """
     client = get_ynab_client()
-    result = await client.get_scheduled_transactions(budget_id)
-    return json.dumps(result, indent=2)
+    return _to_json(await client.get_scheduled_transactions(budget_id))
 
 
 @mcp.tool()
@@ -383,19 +563,24 @@ async def create_scheduled_transaction(
     Returns:
         JSON string with the created scheduled transaction
     """
+    # Reject malformed input before making any API request
+    validate_date(date_first, "date_first")
+    validate_frequency(frequency)
+
     client = get_ynab_client()
-    result = await client.create_scheduled_transaction(
-        budget_id,
-        account_id,
-        date_first,
-        frequency,
-        amount,
-        payee_name,
-        category_id,
-        memo,
-        flag_color,
+    return _to_json(
+        await client.create_scheduled_transaction(
+            budget_id,
+            account_id,
+            date_first,
+            frequency,
+            amount,
+            payee_name,
+            category_id,
+            memo,
+            flag_color,
+        )
     )
-    return json.dumps(result, indent=2)
 
 
 @mcp.tool()
@@ -410,8 +595,7 @@ async def delete_scheduled_transaction(budget_id: str, scheduled_transaction_id:
         JSON string with confirmation
     """
     client = get_ynab_client()
-    result = await client.delete_scheduled_transaction(budget_id, scheduled_transaction_id)
-    return json.dumps(result, indent=2)
+    return _to_json(await client.delete_scheduled_transaction(budget_id, scheduled_transaction_id))
 
 
 @mcp.tool()
@@ -425,8 +609,7 @@ async def get_unapproved_transactions(budget_id: str) -> str:
         JSON string with list of unapproved transactions
     """
     client = get_ynab_client()
-    result = await client.get_unapproved_transactions(budget_id)
-    return json.dumps(result, indent=2)
+    return _to_json(await client.get_unapproved_transactions(budget_id))
 
 
 @mcp.tool()
@@ -447,9 +630,46 @@ async def update_category_budget(
     Returns:
         JSON string with the updated category
     """
+    validate_date(month, "month")
     client = get_ynab_client()
-    result = await client.update_category_budget(budget_id, month, category_id, budgeted)
-    return json.dumps(result, indent=2)
+    return _to_json(await client.update_category_budget(budget_id, month, category_id, budgeted))
+
+
+@mcp.tool()
+async def bulk_update_category_budgets(budget_id: str, month: str, updates: str) -> str:
+    """Update the budgeted amounts for several categories in a month at once.
+
+    Much faster than calling update_category_budget repeatedly when rebalancing a
+    month's budget, since the updates are sent concurrently.
+
+    Args:
+        budget_id: The ID of the budget (use 'last-used' for default budget)
+        month: Month in YYYY-MM-DD format (e.g., 2025-01-01 for January 2025)
+        updates: JSON object mapping category IDs to the budgeted amount to set.
+            Example: '{"cat1": 250.00, "cat2": 75.50}'
+
+    Returns:
+        JSON string with the updated categories, their count, and any per-category errors
+    """
+    validate_date(month, "month")
+    try:
+        updates_map = orjson.loads(updates)
+    except orjson.JSONDecodeError as e:
+        raise YNABValidationError(f"Invalid updates JSON: {e}") from e
+    if (
+        not isinstance(updates_map, dict)
+        or not updates_map
+        or not all(
+            isinstance(amount, int | float) and not isinstance(amount, bool)
+            for amount in updates_map.values()
+        )
+    ):
+        raise YNABValidationError(
+            "updates must be a non-empty JSON object mapping category IDs to amounts"
+        )
+
+    client = get_ynab_client()
+    return _to_json(await client.bulk_update_category_budgets(budget_id, month, updates_map))
 
 
 @mcp.tool()
@@ -475,10 +695,11 @@ async def update_category(
         JSON string with the updated category
     """
     client = get_ynab_client()
-    result = await client.update_category(
-        budget_id, category_id, name, note, category_group_id, goal_target
+    return _to_json(
+        await client.update_category(
+            budget_id, category_id, name, note, category_group_id, goal_target
+        )
     )
-    return json.dumps(result, indent=2)
 
 
 @mcp.tool()
@@ -501,11 +722,11 @@ async def move_category_funds(
     Returns:
         JSON string with updated from and to categories
     """
+    validate_date(month, "month")
     client = get_ynab_client()
-    result = await client.move_category_funds(
-        budget_id, month, from_category_id, to_category_id, amount
+    return _to_json(
+        await client.move_category_funds(budget_id, month, from_category_id, to_category_id, amount)
     )
-    return json.dumps(result, indent=2)
 
 
 @mcp.tool()
@@ -520,8 +741,7 @@ async def get_transaction(budget_id: str, transaction_id: str) -> str:
         JSON string with the transaction details including subtransactions if it's a split transaction
     """
     client = get_ynab_client()
-    result = await client.get_transaction(budget_id, transaction_id)
-    return json.dumps(result, indent=2)
+    return _to_json(await client.get_transaction(budget_id, transaction_id))
 
 
 @mcp.tool()
@@ -566,26 +786,30 @@ async def create_split_transaction(
         - Once created, subtransactions cannot be modified via the API (YNAB limitation)
         - To "split" an existing transaction, you must delete it and create a new split transaction
     """
-    client = get_ynab_client()
+    # Reject malformed input before making any API request
+    validate_date(date)
+    validate_cleared_status(cleared)
 
     # Parse subtransactions JSON string
     try:
-        subtransactions_list = json.loads(subtransactions)
-    except json.JSONDecodeError as e:
+        subtransactions_list = orjson.loads(subtransactions)
+    except orjson.JSONDecodeError as e:
         raise YNABValidationError(f"Invalid subtransactions JSON: {e}") from e
 
-    result = await client.create_split_transaction(
-        budget_id,
-        account_id,
-        date,
-        amount,
-        subtransactions_list,
-        payee_name,
-        memo,
-        cleared,
-        approved,
+    client = get_ynab_client()
+    return _to_json(
+        await client.create_split_transaction(
+            budget_id,
+            account_id,
+            date,
+            amount,
+            subtransactions_list,
+            payee_name,
+            memo,
+            cleared,
+            approved,
+        )
     )
-    return json.dumps(result, indent=2)
 
 
 @mcp.tool()
@@ -627,18 +851,16 @@ async def prepare_split_for_matching(
         - The sum of subtransaction amounts should equal the original transaction amount
         - After matching in YNAB UI, the original transaction will become a split transaction
     """
-    client = get_ynab_client()
-
     # Parse subtransactions JSON string
     try:
-        subtransactions_list = json.loads(subtransactions)
-    except json.JSONDecodeError as e:
+        subtransactions_list = orjson.loads(subtransactions)
+    except orjson.JSONDecodeError as e:
         raise YNABValidationError(f"Invalid subtransactions JSON: {e}") from e
 
-    result = await client.prepare_split_for_matching(
-        budget_id, transaction_id, subtransactions_list
+    client = get_ynab_client()
+    return _to_json(
+        await client.prepare_split_for_matching(budget_id, transaction_id, subtransactions_list)
     )
-    return json.dumps(result, indent=2)
 
 
 @mcp.tool()
@@ -665,8 +887,7 @@ async def start_reconciliation(budget_id: str, account_id: str) -> str:
         Then call complete_reconciliation() with the user's response.
     """
     client = get_ynab_client()
-    result = await client.start_reconciliation(budget_id, account_id)
-    return json.dumps(result, indent=2)
+    return _to_json(await client.start_reconciliation(budget_id, account_id))
 
 
 @mcp.tool()
@@ -701,18 +922,18 @@ async def complete_reconciliation(
         If matches=False:
             Returns the difference between YNAB and bank, and adjustment details if created
     """
-    client = get_ynab_client()
-
     # Parse cleared_transaction_ids JSON string
     try:
-        txn_ids_list = json.loads(cleared_transaction_ids)
-    except json.JSONDecodeError as e:
+        txn_ids_list = orjson.loads(cleared_transaction_ids)
+    except orjson.JSONDecodeError as e:
         raise YNABValidationError(f"Invalid cleared_transaction_ids JSON: {e}") from e
 
-    result = await client.complete_reconciliation(
-        budget_id, account_id, txn_ids_list, matches, bank_balance, create_adjustment
+    client = get_ynab_client()
+    return _to_json(
+        await client.complete_reconciliation(
+            budget_id, account_id, txn_ids_list, matches, bank_balance, create_adjustment
+        )
     )
-    return json.dumps(result, indent=2)
 
 
 @mcp.tool()
@@ -734,28 +955,46 @@ async def health_check() -> str:
         # Make a lightweight API call to verify connectivity
         budgets = await client.get_budgets()
 
-        return json.dumps(
+        return _to_json(
             {
                 "status": "healthy",
                 "api_connected": True,
                 "budgets_count": len(budgets),
                 "message": "YNAB MCP server is running and API is accessible",
-            },
-            indent=2,
+            }
         )
     except Exception as e:
-        logger.error(f"Health check failed: {e}", exc_info=True)
-        return json.dumps(
+        logger.exception("Health check failed: %s", e)
+        return _to_json(
             {
                 "status": "unhealthy",
                 "api_connected": False,
                 "error": str(e),
                 "message": "YNAB MCP server is running but API is not accessible",
-            },
-            indent=2,
+            }
         )
 
 
 def main():
     """Entry point for the MCP server."""
-    mcp.run(transport="stdio")
+    global _json_options
+
+    # Load environment variables once, before any configuration is read from them
+    load_dotenv()
+
+    # Configure logging
+    logging.basicConfig(
+        level=os.getenv("LOG_LEVEL", "INFO"),
+        format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
+    )
+
+    # Indented JSON is easier to read while debugging but roughly doubles response size
+    if os.getenv("YNAB_PRETTY_JSON"):
+        _json_options = orjson.OPT_INDENT_2
+
+    # uvloop (the optional "uvloop" extra) speeds up the event loop where available
+    if sys.platform != "win32" and importlib.util.find_spec("uvloop") is not None:
+        logger.debug("Running with uvloop")
+        anyio.run(mcp.run_stdio_async, backend_options={"use_uvloop": True})
+    else:
+        mcp.run(transport="stdio")
@@ -2,10 +2,32 @@
 
 from __future__ import annotations
 
-from datetime import datetime
+import re
+from datetime import date
 
 from .exceptions import YNABValidationError
 
+VALID_FREQUENCIES = frozenset(
+    {
+        "never",
+        "daily",
+        "weekly",
+        "everyOtherWeek",
+        "twiceAMonth",
+        "every4Weeks",
+        "monthly",
+        "everyOtherMonth",
+        "every3Months",
+        "every4Months",
+        "twiceAYear",
+        "yearly",
+        "everyOtherYear",
+    }
+)
+VALID_CLEARED_STATUSES = frozenset({"cleared", "uncleared", "reconciled"})
+# Shape check before date.fromisoformat, which also accepts forms like 20250101
+_DATE_PATTERN = re.compile(r"[0-9]{4}-[0-9]{2}-[0-9]{2}")
+
 
 def validate_date(date_str: str, param_name: str = "date") -> str:
     """Validate and normalize date string in YYYY-MM-DD format.
@@ -27,7 +49,9 @@ def validate_date(date_str: str, param_name: str = "date") -> str:
         raise YNABValidationError(f"{param_name} must be a string")
 
     try:
-        datetime.strptime(date_str, "%Y-%m-%d")
+        if not _DATE_PATTERN.fullmatch(date_str):
+            raise ValueError(date_str)
+        date.fromisoformat(date_str)
         return date_str
     except ValueError as e:
         raise YNABValidationError(
@@ -71,7 +95,8 @@ def validate_amount(amount: float, param_name: str = "amount") -> float:
     Raises:
         YNABValidationError: If amount is invalid
     """
-    if not isinstance(amount, (int, float)):
+    # bool is an int subclass, but True is not a meaningful amount
+    if not isinstance(amount, (int, float)) or isinstance(amount, bool):
         raise YNABValidationError(f"{param_name} must be a number")
 
     return float(amount)
@@ -128,28 +153,12 @@ def validate_frequency(frequency: str) -> str:
     Raises:
         YNABValidationError: If frequency is invalid
     """
-    valid_frequencies = {
-        "never",
-        "daily",
-        "weekly",
-        "everyOtherWeek",
-        "twiceAMonth",
-        "every4Weeks",
-        "monthly",
-        "everyOtherMonth",
-        "every3Months",
-        "every4Months",
-        "twiceAYear",
-        "yearly",
-        "everyOtherYear",
-    }
-
     if not frequency or not isinstance(frequency, str):
         raise YNABValidationError("frequency must be a non-empty string")
 
-    if frequency not in valid_frequencies:
+    if frequency not in VALID_FREQUENCIES:
         raise YNABValidationError(
-            f"Invalid frequency '{frequency}'. Must be one of: {', '.join(sorted(valid_frequencies))}"
+            f"Invalid frequency '{frequency}'. Must be one of: {', '.join(sorted(VALID_FREQUENCIES))}"
         )
 
     return frequency
@@ -167,14 +176,12 @@ def validate_cleared_status(cleared: str) -> str:
     Raises:
         YNABValidationError: If cleared status is invalid
     """
-    valid_statuses = {"cleared", "uncleared", "reconciled"}
-
     if not cleared or not isinstance(cleared, str):
         raise YNABValidationError("cleared status must be a non-empty string")
 
-    if cleared not in valid_statuses:
+    if cleared not in VALID_CLEARED_STATUSES:
         raise YNABValidationError(
-            f"Invalid cleared status '{cleared}'. Must be one of: {', '.join(sorted(valid_statuses))}"
+            f"Invalid cleared status '{cleared}'. Must be one of: {', '.join(sorted(VALID_CLEARED_STATUSES))}"
         )
 
     return cleared
@@ -2,204 +2,174 @@
 
 from __future__ import annotations
 
-from unittest.mock import AsyncMock, MagicMock, patch
+import asyncio
+from unittest.mock import AsyncMock, patch
 
+import httpx
+import orjson
 import pytest
 
-from src.ynab_mcp.exceptions import YNABValidationError
-from src.ynab_mcp.ynab_client import YNABClient
+from src.ynab_mcp.exceptions import (
+    YNABAPIError,
+    YNABConnectionError,
+    YNABRateLimitError,
+    YNABValidationError,
+)
+from src.ynab_mcp.ynab_client import (
+    MAX_CONCURRENT_REQUESTS,
+    YNABClient,
+    _from_milliunits,
+    _to_milliunits,
+)
 
 
 @pytest.fixture
-def mock_ynab_sdk():
-    """Mock YNAB SDK."""
-    with patch("src.ynab_mcp.ynab_client.YNAB") as mock:
-        yield mock
-
-
-@pytest.fixture
-def client(mock_ynab_sdk):
-    """Create YNABClient instance with mocked SDK."""
+def client():
+    """Create YNABClient instance."""
     return YNABClient("test_token")
 
 
-def test_client_initialization():
-    """Test client initializes with access token."""
-    client = YNABClient("test_token")
-    assert client._access_token == "test_token"
-    assert client.api_base_url == "https://api.ynab.com/v1"
+async def test_client_async_context_manager_closes_http_client():
+    """Test the client closes its HTTP client when used as an async context manager."""
+    http_client = httpx.AsyncClient()
 
+    async with YNABClient("test_token", http_client=http_client) as client:
+        assert client._http_client is http_client
 
-def test_client_initialization_fails_without_token():
-    """Test client raises error without access token."""
-    with pytest.raises(
-        YNABValidationError, match="YNAB_ACCESS_TOKEN environment variable must be set"
-    ):
-        YNABClient(None)
+    assert http_client.is_closed
+    assert client._http_client is None
 
 
-@pytest.mark.asyncio
-async def test_get_budgets(client, mock_ynab_sdk):
+async def test_get_budgets(client):
     """Test get_budgets returns formatted budget list."""
-    # Mock budget response
-    mock_budget = MagicMock()
-    mock_budget.id = "budget-123"
-    mock_budget.name = "Test Budget"
-    mock_budget.last_modified_on = "2025-10-05"
-    mock_budget.currency_format.iso_code = "USD"
-    mock_budget.currency_format.example_format = "$123.45"
-    mock_budget.currency_format.currency_symbol = "$"
-
-    mock_response = MagicMock()
-    mock_response.data.budgets = [mock_budget]
-    client.client.budgets.get_budgets.return_value = mock_response
-
-    result = await client.get_budgets()
-
-    assert len(result) == 1
-    assert result[0]["id"] == "budget-123"
-    assert result[0]["name"] == "Test Budget"
-    assert result[0]["currency_format"]["iso_code"] == "USD"
-
-
-@pytest.mark.asyncio
-async def test_get_accounts(client, mock_ynab_sdk):
-    """Test get_accounts returns formatted account list."""
-    # Mock account response
-    mock_account = MagicMock()
-    mock_account.id = "account-123"
-    mock_account.name = "Checking"
-    mock_account.type = "checking"
-    mock_account.on_budget = True
-    mock_account.closed = False
-    mock_account.balance = 10000000  # $10,000 in milliunits
-    mock_account.deleted = False
+    budgets = [
+        {
+            "id": "budget-123",
+            "name": "Test Budget",
+            "last_modified_on": "2025-10-05",
+            "currency_format": {
+                "iso_code": "USD",
+                "example_format": "$123.45",
+                "currency_symbol": "$",
+            },
+        }
+    ]
 
-    mock_response = MagicMock()
-    mock_response.data.accounts = [mock_account]
-    client.client.accounts.get_accounts.return_value = mock_response
+    with patch.object(client, "_make_request_with_retry", new_callable=AsyncMock) as mock_retry:
+        mock_retry.return_value = {"data": {"budgets": budgets}}
 
-    result = await client.get_accounts("budget-123")
+        result = await client.get_budgets()
 
-    assert len(result) == 1
-    assert result[0]["id"] == "account-123"
-    assert result[0]["name"] == "Checking"
-    assert result[0]["balance"] == 10000.0  # Converted from milliunits
+        assert len(result) == 1
+        assert result[0]["id"] == "budget-123"
+        assert result[0]["name"] == "Test Budget"
+        assert result[0]["currency_format"]["iso_code"] == "USD"
+        assert mock_retry.call_args.args[1].endswith("/budgets")
 
 
-@pytest.mark.asyncio
-async def test_get_accounts_skips_deleted(client, mock_ynab_sdk):
-    """Test get_accounts skips deleted accounts."""
-    # Mock deleted account
-    mock_account = MagicMock()
-    mock_account.deleted = True
+@pytest.mark.parametrize(("deleted", "expected_count"), [(False, 1), (True, 0)])
+async def test_get_accounts(client, deleted, expected_count):
+    """Test get_accounts returns formatted accounts and skips deleted ones."""
+    accounts = [
+        {
+            "id": "account-123",
+            "name": "Checking",
+            "type": "checking",
+            "on_budget": True,
+            "closed": False,
+            "balance": 10000000,  # $10,000 in milliunits
+            "deleted": deleted,
+        }
+    ]
 
-    mock_response = MagicMock()
-    mock_response.data.accounts = [mock_account]
-    client.client.accounts.get_accounts.return_value = mock_response
+    with patch.object(client, "_make_request_with_retry", new_callable=AsyncMock) as mock_retry:
+        mock_retry.return_value = {"data": {"accounts": accounts}}
 
-    result = await client.get_accounts("budget-123")
+        result = await client.get_accounts("budget-123")
 
-    assert len(result) == 0
+        assert len(result) == expected_count
+        if expected_count:
+            assert result[0]["id"] == "account-123"
+            assert result[0]["name"] == "Checking"
+            assert result[0]["balance"] == 10000.0  # Converted from milliunits
 
 
-@pytest.mark.asyncio
-async def test_get_categories(client, mock_ynab_sdk):
+async def test_get_categories(client):
     """Test get_categories returns formatted category list."""
-    # Mock category response
-    mock_category = MagicMock()
-    mock_category.id = "cat-123"
-    mock_category.name = "Groceries"
-    mock_category.balance = 50000  # $50 in milliunits
-    mock_category.hidden = False
-    mock_category.deleted = False
-
-    mock_group = MagicMock()
-    mock_group.id = "group-123"
-    mock_group.name = "Food"
-    mock_group.hidden = False
-    mock_group.categories = [mock_category]
-
-    mock_response = MagicMock()
-    mock_response.data.category_groups = [mock_group]
-    client.client.categories.get_categories.return_value = mock_response
-
-    result = await client.get_categories("budget-123")
-
-    assert len(result) == 1
-    assert result[0]["name"] == "Food"
-    assert len(result[0]["categories"]) == 1
-    assert result[0]["categories"][0]["name"] == "Groceries"
-    assert result[0]["categories"][0]["balance"] == 50.0
-
-
-@pytest.mark.asyncio
-async def test_get_categories_skips_hidden_by_default(client, mock_ynab_sdk):
-    """Test get_categories skips hidden categories by default."""
-    # Mock hidden category
-    mock_category = MagicMock()
-    mock_category.hidden = True
-    mock_category.deleted = False
-
-    mock_group = MagicMock()
-    mock_group.id = "group-123"
-    mock_group.name = "Hidden Group"
-    mock_group.hidden = False
-    mock_group.categories = [mock_category]
-
-    mock_response = MagicMock()
-    mock_response.data.category_groups = [mock_group]
-    client.client.categories.get_categories.return_value = mock_response
-
-    result = await client.get_categories("budget-123", include_hidden=False)
-
-    # Should skip the group since it has no visible categories
-    assert len(result) == 0
-
-
-@pytest.mark.asyncio
-async def test_get_categories_includes_hidden_when_requested(client, mock_ynab_sdk):
-    """Test get_categories includes hidden categories when requested."""
-    # Mock hidden category
-    mock_category = MagicMock()
-    mock_category.id = "cat-123"
-    mock_category.name = "Hidden Cat"
-    mock_category.balance = 0
-    mock_category.hidden = True
-    mock_category.deleted = False
-
-    mock_group = MagicMock()
-    mock_group.id = "group-123"
-    mock_group.name = "Group"
-    mock_group.hidden = False
-    mock_group.categories = [mock_category]
-
-    mock_response = MagicMock()
-    mock_response.data.category_groups = [mock_group]
-    client.client.categories.get_categories.return_value = mock_response
-
-    result = await client.get_categories("budget-123", include_hidden=True)
-
-    assert len(result) == 1
-    assert result[0]["categories"][0]["hidden"]
-
-
-@pytest.mark.asyncio
-async def test_milliunits_conversion():
-    """Test milliunits conversion for various amounts."""
-    YNABClient("test_token")
-
-    # Test conversion from milliunits to dollars
-    assert 10000000 / 1000 == 10000.0
-    assert 1234567 / 1000 == 1234.567
-    assert -50000 / 1000 == -50.0
-
-    # Test conversion from dollars to milliunits
-    assert int(100.50 * 1000) == 100500
-    assert int(-25.75 * 1000) == -25750
-
-
-@pytest.mark.asyncio
+    category_groups = [
+        {
+            "id": "group-123",
+            "name": "Food",
+            "hidden": False,
+            "categories": [
+                {
+                    "id": "cat-123",
+                    "name": "Groceries",
+                    "balance": 50000,  # $50 in milliunits
+                    "hidden": False,
+                    "deleted": False,
+                }
+            ],
+        }
+    ]
+
+    with patch.object(client, "_make_request_with_retry", new_callable=AsyncMock) as mock_retry:
+        mock_retry.return_value = {"data": {"category_groups": category_groups}}
+
+        result = await client.get_categories("budget-123")
+
+        assert len(result) == 1
+        assert result[0]["name"] == "Food"
+        assert len(result[0]["categories"]) == 1
+        assert result[0]["categories"][0]["name"] == "Groceries"
+        assert result[0]["categories"][0]["balance"] == 50.0
+
+
+@pytest.mark.parametrize(
+    ("hidden", "include_hidden", "expected_groups"),
+    [(False, False, 1), (True, False, 0), (True, True, 1)],
+)
+async def test_get_categories_hidden_filter(client, hidden, include_hidden, expected_groups):
+    """Test hidden categories are skipped unless requested, dropping emptied groups."""
+    category_groups = [
+        {
+            "id": "group-123",
+            "name": "Group",
+            "hidden": False,
+            "categories": [
+                {"id": "cat-123", "name": "Cat", "balance": 0, "hidden": hidden, "deleted": False}
+            ],
+        }
+    ]
+
+    with patch.object(client, "_make_request_with_retry", new_callable=AsyncMock) as mock_retry:
+        mock_retry.return_value = {"data": {"category_groups": category_groups}}
+
+        result = await client.get_categories("budget-123", include_hidden=include_hidden)
+
+        assert len(result) == expected_groups
+        if expected_groups:
+            assert result[0]["categories"][0]["hidden"] is hidden
+
+
+@pytest.mark.parametrize(
+    ("milliunits", "amount"),
+    [(10000000, 10000.0), (1234567, 1234.567), (-50000, -50.0), (None, 0)],
+)
+def test_from_milliunits(milliunits, amount):
+    """Test milliunits convert to currency amounts."""
+    assert _from_milliunits(milliunits) == amount
+
+
+@pytest.mark.parametrize(
+    ("amount", "milliunits"),
+    [(100.50, 100500), (-25.75, -25750), (0.1, 100), (64.1, 64100)],
+)
+def test_to_milliunits_rounds(amount, milliunits):
+    """Test currency amounts convert to milliunits without float truncation."""
+    assert _to_milliunits(amount) == milliunits
+
+
 async def test_search_transactions_handles_null_fields(client):
     """Test search_transactions handles null payee_name and memo."""
     with patch.object(client, "_make_request_with_retry", new_callable=AsyncMock) as mock_retry:
@@ -232,11 +202,33 @@ async def test_search_transactions_handles_null_fields(client):
         assert result["transactions"][0]["id"] == "txn-2"
 
 
-@pytest.mark.asyncio
-async def test_pagination_calculations(client):
-    """Test pagination metadata calculations."""
-    # Mock 250 transactions
-    transactions = [
+async def test_search_transactions_matches_literal_text_case_insensitively(client):
+    """Test search terms are matched literally, ignoring case."""
+    with patch.object(client, "_make_request_with_retry", new_callable=AsyncMock) as mock_retry:
+        mock_retry.return_value = {
+            "data": {
+                "transactions": [
+                    {"id": "txn-1", "date": "2025-10-01", "amount": -5000, "payee_name": "AB Co"},
+                    {
+                        "id": "txn-2",
+                        "date": "2025-10-02",
+                        "amount": -3000,
+                        "payee_name": "A+B Deli",
+                    },
+                    {"id": "txn-3", "date": "2025-10-03", "amount": -1000, "memo": "lunch at a+b"},
+                ]
+            }
+        }
+
+        result = await client.search_transactions("budget-123", "A+b")
+
+        assert [txn["id"] for txn in result["transactions"]] == ["txn-2", "txn-3"]
+
+
+@pytest.fixture(scope="module")
+def many_transactions():
+    """250 transactions, built once for the pagination tests."""
+    return [
         {
             "id": f"txn-{i}",
             "date": "2025-10-01",
@@ -245,31 +237,55 @@ async def test_pagination_calculations(client):
         for i in range(250)
     ]
 
+
+@pytest.mark.parametrize(
+    ("page", "expected_len", "has_next", "has_prev"),
+    [(1, 100, True, False), (3, 50, False, True)],
+)
+async def test_pagination_calculations(
+    client, many_transactions, page, expected_len, has_next, has_prev
+):
+    """Test pagination metadata calculations."""
     with patch.object(client, "_make_request_with_retry", new_callable=AsyncMock) as mock_retry:
-        # Mock API response
-        mock_retry.return_value = {"data": {"transactions": transactions}}
+        mock_retry.return_value = {"data": {"transactions": many_transactions}}
 
-        # Get page 1 with limit 100
-        result = await client.get_transactions("budget-123", limit=100, page=1)
+        result = await client.get_transactions("budget-123", limit=100, page=page)
 
-        assert result["pagination"]["page"] == 1
+        assert result["pagination"]["page"] == page
         assert result["pagination"]["per_page"] == 100
         assert result["pagination"]["total_count"] == 250
         assert result["pagination"]["total_pages"] == 3
-        assert result["pagination"]["has_next_page"]
-        assert not result["pagination"]["has_prev_page"]
-        assert len(result["transactions"]) == 100
+        assert result["pagination"]["has_next_page"] is has_next
+        assert result["pagination"]["has_prev_page"] is has_prev
+        assert len(result["transactions"]) == expected_len
 
-        # Get page 3 (last page)
-        result = await client.get_transactions("budget-123", limit=100, page=3)
 
-        assert result["pagination"]["page"] == 3
-        assert not result["pagination"]["has_next_page"]
-        assert result["pagination"]["has_prev_page"]
-        assert len(result["transactions"]) == 50  # Remaining transactions
+async def test_get_transactions_uses_category_endpoint(client):
+    """Test category filters go to YNAB's category endpoint unless an account is given."""
+    transactions = [
+        {"id": "txn-1", "date": "2025-10-01", "amount": -1000, "category_id": "cat-1"},
+        {"id": "txn-2", "date": "2025-10-02", "amount": -2000, "category_id": "cat-2"},
+    ]
+
+    with patch.object(client, "_make_request_with_retry", new_callable=AsyncMock) as mock_retry:
+        mock_retry.return_value = {"data": {"transactions": transactions[:1]}}
+        by_category = await client.get_transactions("budget-123", category_id="cat-1")
+        assert mock_retry.call_args.args[1].endswith(
+            "/budgets/budget-123/categories/cat-1/transactions"
+        )
+
+        mock_retry.return_value = {"data": {"transactions": transactions}}
+        by_account = await client.get_transactions(
+            "budget-123", account_id="acct-1", category_id="cat-1"
+        )
+        assert mock_retry.call_args.args[1].endswith(
+            "/budgets/budget-123/accounts/acct-1/transactions"
+        )
+
+    assert [t["id"] for t in by_category["transactions"]] == ["txn-1"]
+    assert [t["id"] for t in by_account["transactions"]] == ["txn-1"]
 
 
-@pytest.mark.asyncio
 async def test_get_category_spending_summary(client):
     """Test get_category_spending_summary aggregates correctly."""
     # Mock transactions over 3 months
@@ -313,7 +329,25 @@ async def test_get_category_spending_summary(client):
         assert result["monthly_breakdown"][2]["spent"] == -11.0
 
 
-@pytest.mark.asyncio
+async def test_category_spending_summary_totals_are_exact(client):
+    """Test spending totals are summed in milliunits, without float drift."""
+    transactions = [
+        {"id": "txn-1", "date": "2025-01-15", "amount": -100, "category_id": "cat-123"},
+        {"id": "txn-2", "date": "2025-01-20", "amount": -200, "category_id": "cat-123"},
+    ]
+
+    with patch.object(client, "_make_request_with_retry", new_callable=AsyncMock) as mock_retry:
+        mock_retry.return_value = {"data": {"transactions": transactions}}
+
+        result = await client.get_category_spending_summary(
+            "budget-123", "cat-123", "2025-01-01", "2025-01-31", include_graph=False
+        )
+
+    # Summing -0.1 and -0.2 as floats would give -0.30000000000000004
+    assert result["total_spent"] == -0.3
+    assert result["monthly_breakdown"] == [{"month": "2025-01", "spent": -0.3}]
+
+
 async def test_compare_spending_by_year(client):
     """Test compare_spending_by_year calculates year-over-year correctly."""
     # Mock transactions over 3 years
@@ -366,7 +400,6 @@ async def test_compare_spending_by_year(client):
         assert result["yearly_comparison"][2]["percent_change"] == pytest.approx(20.0, rel=0.01)
 
 
-@pytest.mark.asyncio
 async def test_compare_spending_by_year_handles_zero_spending(client):
     """Test compare_spending_by_year handles years with zero spending."""
     # Mock transactions with gap year
@@ -395,7 +428,6 @@ async def test_compare_spending_by_year_handles_zero_spending(client):
         assert result["yearly_comparison"][1]["percent_change"] == pytest.approx(100.0, rel=0.01)
 
 
-@pytest.mark.asyncio
 async def test_get_category_spending_summary_with_graph(client):
     """Test get_category_spending_summary includes graph when requested."""
     # Mock transactions over 2 months
@@ -421,7 +453,6 @@ async def test_get_category_spending_summary_with_graph(client):
         assert "2025-02" in result["graph"]
 
 
-@pytest.mark.asyncio
 async def test_compare_spending_by_year_with_graph(client):
     """Test compare_spending_by_year includes graph when requested."""
     # Mock transactions over 2 years
@@ -447,7 +478,6 @@ async def test_compare_spending_by_year_with_graph(client):
         assert "2024" in result["graph"]
 
 
-@pytest.mark.asyncio
 async def test_get_scheduled_transactions(client):
     """Test get_scheduled_transactions returns formatted scheduled transactions."""
     # Mock scheduled transactions response
@@ -506,7 +536,6 @@ async def test_get_scheduled_transactions(client):
         assert result[1]["payee_name"] == "Employer"
 
 
-@pytest.mark.asyncio
 async def test_create_scheduled_transaction(client):
     """Test create_scheduled_transaction sends correct data."""
     # Mock successful creation response
@@ -555,7 +584,6 @@ async def test_create_scheduled_transaction(client):
         assert txn_data["frequency"] == "monthly"
 
 
-@pytest.mark.asyncio
 async def test_delete_scheduled_transaction(client):
     """Test delete_scheduled_transaction sends correct request."""
     # Mock successful deletion response
@@ -579,7 +607,417 @@ async def test_delete_scheduled_transaction(client):
         assert "sched-123" in call_args.args[1]
 
 
-@pytest.mark.asyncio
+async def test_get_scheduled_transactions_is_cached(client):
+    """Test repeated reads are served from the cache."""
+    with patch.object(client, "_make_request_with_retry", new_callable=AsyncMock) as mock_retry:
+        mock_retry.return_value = {"data": {"scheduled_transactions": []}}
+
+        await client.get_scheduled_transactions("budget-123")
+        await client.get_scheduled_transactions("budget-123")
+        await client.get_scheduled_transactions("budget-456")
+
+        assert mock_retry.call_count == 2
+
+
+async def test_cache_can_be_disabled():
+    """Test a zero cache TTL sends every read upstream."""
+    client = YNABClient("test_token", cache_ttl=0)
+    with patch.object(client, "_make_request_with_retry", new_callable=AsyncMock) as mock_retry:
+        mock_retry.return_value = {"data": {"scheduled_transactions": []}}
+
+        await client.get_scheduled_transactions("budget-123")
+        await client.get_scheduled_transactions("budget-123")
+
+        assert mock_retry.call_count == 2
+
+
+async def test_concurrent_cache_misses_share_one_call():
+    """Test concurrent misses for the same cached read run the method only once."""
+    client = YNABClient("test_token")
+
+    async def slow_get(url, **kwargs):
+        await asyncio.sleep(0)
+        return {"data": {"scheduled_transactions": []}}
+
+    with patch.object(client, "_get", new=AsyncMock(side_effect=slow_get)) as mock_get:
+        first, second = await asyncio.gather(
+            client.get_scheduled_transactions("budget-123"),
+            client.get_scheduled_transactions("budget-123"),
+        )
+
+        assert first is second
+        mock_get.assert_called_once()
+
+
+async def test_write_request_invalidates_cached_reads():
+    """Test a write through the client drops cached reads."""
+    requests = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        assert request.headers["Authorization"] == "Bearer test_token"
+        assert request.headers["Accept"] == "application/json"
+        requests.append(request.method)
+        if request.method == "DELETE":
+            return httpx.Response(
+                200, json={"data": {"scheduled_transaction": {"id": "sched-1", "deleted": True}}}
+            )
+        return httpx.Response(200, json={"data": {"scheduled_transactions": []}})
+
+    client = YNABClient(
+        "test_token", http_client=httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    )
+
+    await client.get_scheduled_transactions("budget-123")
+    await client.get_scheduled_transactions("budget-123")
+    await client.delete_scheduled_transaction("budget-123", "sched-1")
+    await client.get_scheduled_transactions("budget-123")
+
+    assert requests == ["GET", "DELETE", "GET"]
+
+
+async def test_write_request_keeps_cached_reads_for_other_budgets():
+    """Test a write only drops cached reads for the budget it touched."""
+    requests = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests.append((request.method, request.url.path))
+        if request.method == "DELETE":
+            return httpx.Response(
+                200, json={"data": {"scheduled_transaction": {"id": "sched-1", "deleted": True}}}
+            )
+        return httpx.Response(200, json={"data": {"scheduled_transactions": []}})
+
+    client = YNABClient(
+        "test_token", http_client=httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    )
+
+    await client.get_scheduled_transactions("budget-a")
+    await client.get_scheduled_transactions("budget-b")
+    await client.delete_scheduled_transaction("budget-a", "sched-1")
+    await client.get_scheduled_transactions("budget-a")
+    await client.get_scheduled_transactions("budget-b")
+
+    assert [path for method, path in requests if method == "GET"] == [
+        "/v1/budgets/budget-a/scheduled_transactions",
+        "/v1/budgets/budget-b/scheduled_transactions",
+        "/v1/budgets/budget-a/scheduled_transactions",
+    ]
+
+
+async def test_stream_transactions_yields_parsed_rows():
+    """Test transactions are streamed from the category endpoint and filtered per row."""
+    payload = {
+        "data": {
+            "transactions": [
+                {"id": "txn-1", "date": "2025-10-01", "amount": -12340, "category_id": "cat-1"},
+                {"id": "txn-3", "date": "2025-11-01", "amount": 75000, "category_id": "cat-1"},
+            ],
+            "server_knowledge": 42,
+        }
+    }
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        assert request.url.path == "/v1/budgets/budget-123/categories/cat-1/transactions"
+        assert request.url.params["since_date"] == "2025-10-01"
+        return httpx.Response(200, json=payload)
+
+    client = YNABClient(
+        "test_token", http_client=httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    )
+
+    transactions = [
+        txn
+        async for txn in client.stream_transactions(
+            "budget-123", since_date="2025-10-01", until_date="2025-10-31", category_id="cat-1"
+        )
+    ]
+
+    assert [(t["id"], t["amount"]) for t in transactions] == [("txn-1", -12.34)]
+
+
+async def test_stream_transactions_releases_request_slot_while_consumed():
+    """Test a paused stream consumer does not hold a concurrency slot."""
+    payload = {"data": {"transactions": [{"id": "txn-1", "date": "2025-10-01", "amount": 0}]}}
+    client = YNABClient(
+        "test_token",
+        http_client=httpx.AsyncClient(
+            transport=httpx.MockTransport(lambda _: httpx.Response(200, json=payload))
+        ),
+    )
+    client._request_slots = asyncio.Semaphore(1)
+
+    stream = client.stream_transactions("budget-123")
+    try:
+        assert (await anext(stream))["id"] == "txn-1"
+        # Would time out if the paused stream still held the only slot
+        result = await asyncio.wait_for(
+            client._make_request_with_retry("get", "https://api.ynab.com/v1/budgets"), timeout=1
+        )
+    finally:
+        await stream.aclose()
+
+    assert result == payload
+
+
+@pytest.mark.parametrize(
+    "failure",
+    [
+        b'{"data": {"transactions": [{"id": "txn-',
+        httpx.RemoteProtocolError("peer closed connection"),
+    ],
+    ids=["truncated-body", "protocol-error"],
+)
+async def test_stream_transactions_wraps_unexpected_errors(failure):
+    """Test malformed bodies and protocol errors surface as YNABAPIError."""
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        if isinstance(failure, Exception):
+            raise failure
+        return httpx.Response(200, content=failure)
+
+    client = YNABClient(
+        "test_token", http_client=httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    )
+
+    with pytest.raises(YNABAPIError, match="Unexpected error"):
+        async for _ in client.stream_transactions("budget-123"):
+            pass
+
+
+async def test_stream_transactions_raises_api_error():
+    """Test a failed streamed request raises YNABAPIError with the error detail."""
+    client = YNABClient(
+        "test_token",
+        http_client=httpx.AsyncClient(
+            transport=httpx.MockTransport(
+                lambda _: httpx.Response(404, json={"error": {"detail": "Budget not found"}})
+            )
+        ),
+    )
+
+    with pytest.raises(YNABAPIError, match="Budget not found"):
+        async for _ in client.stream_transactions("missing"):
+            pass
+
+
+async def test_api_error_includes_bounded_detail():
+    """Test HTTP errors surface YNAB's error detail, truncated to a bounded length."""
+    responses = iter(
+        [
+            httpx.Response(
+                404,
+                json={"error": {"id": "404.2", "name": "resource_not_found", "detail": "Nope"}},
+            ),
+            httpx.Response(500, text="x" * 10_000),
+        ]
+    )
+    client = YNABClient(
+        "test_token",
+        http_client=httpx.AsyncClient(transport=httpx.MockTransport(lambda _: next(responses))),
+    )
+
+    with pytest.raises(YNABAPIError, match="HTTP 404 - Nope") as exc_info:
+        await client._make_request_with_retry("get", "https://api.ynab.com/v1/budgets/missing")
+    assert exc_info.value.status_code == 404
+
+    # POST isn't retried on server errors, so the 500 surfaces straight away
+    with pytest.raises(YNABAPIError) as exc_info:
+        await client._make_request_with_retry("post", "https://api.ynab.com/v1/budgets")
+    assert exc_info.value.status_code == 500
+    assert len(str(exc_info.value)) < 600
+
+
+async def test_method_errors_keep_their_type_and_status(client):
+    """Test client methods add context to API errors without losing the status code."""
+    with (
+        patch.object(
+            client,
+            "_make_request_with_retry",
+            new_callable=AsyncMock,
+            side_effect=YNABAPIError("API request failed: HTTP 404", status_code=404),
+        ),
+        pytest.raises(YNABAPIError, match="Failed to get accounts: API request failed") as exc_info,
+    ):
+        await client.get_accounts("budget-123")
+
+    assert exc_info.value.status_code == 404
+
+
+async def test_server_errors_are_retried_for_idempotent_requests():
+    """Test a transient 5xx on a GET is retried with backoff."""
+    responses = iter(
+        [
+            httpx.Response(503, headers={"Retry-After": "2"}),
+            httpx.Response(200, json={"data": {"budgets": []}}),
+        ]
+    )
+    client = YNABClient(
+        "test_token",
+        http_client=httpx.AsyncClient(transport=httpx.MockTransport(lambda _: next(responses))),
+    )
+
+    with patch("src.ynab_mcp.ynab_client.asyncio.sleep", new_callable=AsyncMock) as mock_sleep:
+        result = await client._make_request_with_retry("get", "https://api.ynab.com/v1/budgets")
+
+    assert result == {"data": {"budgets": []}}
+    mock_sleep.assert_awaited_once_with(2.0)
+
+
+@pytest.mark.parametrize(
+    ("retry_after", "expected_delay"),
+    [("Wed, 21 Oct 2026 07:28:00 GMT", None), ("3600", 8.0), ("-5", 0.0)],
+)
+async def test_server_error_retry_after_is_parsed_defensively(retry_after, expected_delay):
+    """Test an HTTP-date, huge or negative Retry-After on a 5xx still retries sanely."""
+    responses = iter(
+        [
+            httpx.Response(503, headers={"Retry-After": retry_after}),
+            httpx.Response(200, json={"data": {"budgets": []}}),
+        ]
+    )
+    client = YNABClient(
+        "test_token",
+        http_client=httpx.AsyncClient(transport=httpx.MockTransport(lambda _: next(responses))),
+    )
+
+    with (
+        patch("src.ynab_mcp.ynab_client.asyncio.sleep", new_callable=AsyncMock) as mock_sleep,
+        patch("src.ynab_mcp.ynab_client._backoff_delay", return_value=0.5),
+    ):
+        result = await client._make_request_with_retry("get", "https://api.ynab.com/v1/budgets")
+
+    assert result == {"data": {"budgets": []}}
+    mock_sleep.assert_awaited_once_with(0.5 if expected_delay is None else expected_delay)
+
+
+@pytest.mark.parametrize(
+    ("method", "error", "expected_attempts"),
+    [
+        ("get", httpx.ReadTimeout("timed out"), 2),
+        ("post", httpx.ReadTimeout("timed out"), 1),
+        ("post", httpx.ConnectError("refused"), 2),
+    ],
+)
+async def test_transport_errors_resend_only_when_safe(method, error, expected_attempts):
+    """Test a POST that may have reached YNAB is not resent, while a failed connect is."""
+    attempts = 0
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        nonlocal attempts
+        attempts += 1
+        raise error
+
+    client = YNABClient(
+        "test_token",
+        http_client=httpx.AsyncClient(transport=httpx.MockTransport(handler)),
+        max_retries=2,
+    )
+
+    with (
+        patch("src.ynab_mcp.ynab_client.asyncio.sleep", new_callable=AsyncMock),
+        pytest.raises(YNABConnectionError),
+    ):
+        await client._make_request_with_retry(
+            method, "https://api.ynab.com/v1/budgets/budget-123/transactions"
+        )
+
+    assert attempts == expected_attempts
+
+
+async def test_concurrent_requests_are_bounded():
+    """Test a burst of requests never has more than the client limit in flight."""
+    in_flight = 0
+    peak = 0
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        await asyncio.sleep(0.01)
+        in_flight -= 1
+        return httpx.Response(200, json={"data": {}})
+
+    client = YNABClient(
+        "test_token", http_client=httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    )
+
+    await asyncio.gather(
+        *(
+            client._make_request_with_retry("get", f"https://api.ynab.com/v1/budgets/b-{i}")
+            for i in range(MAX_CONCURRENT_REQUESTS * 2)
+        )
+    )
+
+    assert peak == MAX_CONCURRENT_REQUESTS
+
+
+async def test_json_bodies_are_encoded_with_orjson():
+    """Test request bodies are sent as orjson-encoded JSON."""
+    sent = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        sent.append(request)
+        return httpx.Response(200, json={"data": {}})
+
+    client = YNABClient(
+        "test_token", http_client=httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    )
+    body = {"category": {"budgeted": 125000, "note": "Café"}}
+
+    await client._make_request_with_retry(
+        "patch", "https://api.ynab.com/v1/budgets/budget-123/categories/cat-1", json=body
+    )
+
+    assert sent[0].headers["Content-Type"] == "application/json"
+    assert sent[0].content == orjson.dumps(body)
+
+
+async def test_retry_backoff_is_jittered_without_retry_after():
+    """Test retries without a Retry-After header sleep a jittered, bounded delay."""
+    responses = iter(
+        [
+            httpx.Response(502),
+            httpx.Response(200, json={"data": {"budgets": []}}),
+        ]
+    )
+    client = YNABClient(
+        "test_token",
+        http_client=httpx.AsyncClient(transport=httpx.MockTransport(lambda _: next(responses))),
+    )
+
+    with (
+        patch("src.ynab_mcp.ynab_client.random.uniform", return_value=0.42) as mock_uniform,
+        patch("src.ynab_mcp.ynab_client.asyncio.sleep", new_callable=AsyncMock) as mock_sleep,
+    ):
+        await client._make_request_with_retry("get", "https://api.ynab.com/v1/budgets")
+
+    mock_uniform.assert_called_once_with(0, 1)
+    mock_sleep.assert_awaited_once_with(0.42)
+
+
+async def test_rate_limit_not_retried_when_quota_exhausted():
+    """Test a 429 with X-Rate-Limit at its ceiling raises instead of sleeping."""
+    client = YNABClient(
+        "test_token",
+        http_client=httpx.AsyncClient(
+            transport=httpx.MockTransport(
+                lambda _: httpx.Response(
+                    429, headers={"Retry-After": "120", "X-Rate-Limit": "200/200"}
+                )
+            )
+        ),
+    )
+
+    with (
+        patch("src.ynab_mcp.ynab_client.asyncio.sleep", new_callable=AsyncMock) as mock_sleep,
+        pytest.raises(YNABRateLimitError) as exc_info,
+    ):
+        await client._make_request_with_retry("get", "https://api.ynab.com/v1/budgets")
+
+    assert exc_info.value.retry_after == 120
+    mock_sleep.assert_not_awaited()
+
+
 async def test_get_transaction(client):
     """Test get_transaction returns formatted transaction with subtransactions."""
     # Mock transaction response with subtransactions
@@ -655,7 +1093,27 @@ async def test_get_transaction(client):
         assert "txn-123" in call_args.args[1]
 
 
-@pytest.mark.asyncio
+async def test_concurrent_identical_reads_share_one_request(client):
+    """Test concurrent identical GETs are coalesced into a single upstream request."""
+    txn_data = {"id": "txn-123", "date": "2025-10-06", "amount": -80000}
+
+    with patch.object(client, "_make_request_with_retry", new_callable=AsyncMock) as mock_retry:
+        mock_retry.return_value = {"data": {"transaction": txn_data}}
+
+        first, second = await asyncio.gather(
+            client.get_transaction("budget-123", "txn-123"),
+            client.get_transaction("budget-123", "txn-123"),
+        )
+
+        assert first == second
+        assert first["amount"] == -80.0
+        mock_retry.assert_called_once()
+
+        # Once the shared request completes, later calls go upstream again
+        await client.get_transaction("budget-123", "txn-123")
+        assert mock_retry.call_count == 2
+
+
 async def test_get_transaction_without_subtransactions(client):
     """Test get_transaction for regular transactions without splits."""
     # Mock regular transaction response (no subtransactions)
@@ -688,7 +1146,6 @@ async def test_get_transaction_without_subtransactions(client):
         assert result["subtransactions"] is None  # No subtransactions for regular transactions
 
 
-@pytest.mark.asyncio
 async def test_create_split_transaction(client):
     """Test create_split_transaction sends correct data and handles response."""
     # Mock successful creation response
@@ -773,7 +1230,6 @@ async def test_create_split_transaction(client):
         assert txn_data["subtransactions"][1]["amount"] == -30000
 
 
-@pytest.mark.asyncio
 async def test_prepare_split_for_matching(client):
     """Test prepare_split_for_matching fetches original and creates split."""
     # Mock original transaction
@@ -865,7 +1321,6 @@ async def test_prepare_split_for_matching(client):
         assert mock_retry.call_count == 2
 
 
-@pytest.mark.asyncio
 async def test_start_reconciliation(client):
     """Test start_reconciliation returns account data for reconciliation."""
     # Mock account response
@@ -967,7 +1422,6 @@ async def test_start_reconciliation(client):
         assert mock_retry.call_count == 2
 
 
-@pytest.mark.asyncio
 async def test_complete_reconciliation_matches(client):
     """Test complete_reconciliation when balances match."""
     # Mock successful reconciliation
@@ -999,7 +1453,6 @@ async def test_complete_reconciliation_matches(client):
         assert mock_retry.call_count == 3
 
 
-@pytest.mark.asyncio
 async def test_complete_reconciliation_discrepancy_no_adjustment(client):
     """Test complete_reconciliation when balances don't match, no adjustment."""
     # Mock account response with cleared balance
@@ -1033,7 +1486,6 @@ async def test_complete_reconciliation_discrepancy_no_adjustment(client):
         assert mock_retry.call_count == 1
 
 
-@pytest.mark.asyncio
 async def test_complete_reconciliation_discrepancy_with_adjustment(client):
     """Test complete_reconciliation when balances don't match, with adjustment."""
     # Mock account response
@@ -1058,7 +1510,7 @@ async def test_complete_reconciliation_discrepancy_with_adjustment(client):
         # Mock API responses: first for account, second for creating adjustment
         mock_retry.side_effect = [
             {"data": {"account": account_data}},
-            {"data": {"transaction": adjustment_txn}},
+            {"data": {"transactions": [adjustment_txn]}},
         ]
 
         result = await client.complete_reconciliation(
@@ -1084,7 +1536,6 @@ async def test_complete_reconciliation_discrepancy_with_adjustment(client):
         assert mock_retry.call_count == 2
 
 
-@pytest.mark.asyncio
 async def test_complete_reconciliation_requires_bank_balance_when_no_match(client):
     """Test complete_reconciliation raises error if bank_balance not provided when matches=False."""
     with pytest.raises(Exception, match="bank_balance is required"):
@@ -1097,7 +1548,6 @@ async def test_complete_reconciliation_requires_bank_balance_when_no_match(clien
         )
 
 
-@pytest.mark.asyncio
 async def test_complete_reconciliation_handles_failed_transactions(client):
     """Test complete_reconciliation handles some transactions failing to reconcile."""
 
@@ -1105,7 +1555,7 @@ async def test_complete_reconciliation_handles_failed_transactions(client):
         # Mock: first transaction succeeds, second fails, third succeeds
         mock_retry.side_effect = [
             {"data": {"transaction": {"id": "txn-1", "cleared": "reconciled"}}},
-            Exception("API Error"),
+            YNABAPIError("API Error", status_code=500),
             {"data": {"transaction": {"id": "txn-3", "cleared": "reconciled"}}},
         ]
 
@@ -1125,7 +1575,17 @@ async def test_complete_reconciliation_handles_failed_transactions(client):
         assert mock_retry.call_count == 3
 
 
-@pytest.mark.asyncio
+def _month_and_groups_responses(month_data, category_groups):
+    """Build a request side effect answering the month and categories endpoints."""
+
+    async def respond(method, url, **kwargs):
+        if "/months/" in url:
+            return {"data": {"month": month_data}}
+        return {"data": {"category_groups": category_groups}}
+
+    return respond
+
+
 async def test_get_underfunded_goals(client):
     """Test get_underfunded_goals returns summary of underfunded categories."""
     # Mock month data with underfunded categories
@@ -1172,33 +1632,18 @@ async def test_get_underfunded_goals(client):
     }
 
     # Mock category groups for mapping
-    mock_cat_1 = MagicMock()
-    mock_cat_1.id = "cat-1"
-
-    mock_cat_2 = MagicMock()
-    mock_cat_2.id = "cat-2"
-
-    mock_cat_3 = MagicMock()
-    mock_cat_3.id = "cat-3"
-
-    mock_cat_4 = MagicMock()
-    mock_cat_4.id = "cat-4"
-
-    mock_group_1 = MagicMock()
-    mock_group_1.name = "Savings"
-    mock_group_1.categories = [mock_cat_1]
-
-    mock_group_2 = MagicMock()
-    mock_group_2.name = "Monthly Bills"
-    mock_group_2.categories = [mock_cat_2, mock_cat_3, mock_cat_4]
-
-    mock_response = MagicMock()
-    mock_response.data.category_groups = [mock_group_1, mock_group_2]
-    client.client.categories.get_categories.return_value = mock_response
+    category_groups = [
+        {"id": "group-1", "name": "Savings", "categories": [{"id": "cat-1"}]},
+        {
+            "id": "group-2",
+            "name": "Monthly Bills",
+            "categories": [{"id": "cat-2"}, {"id": "cat-3"}, {"id": "cat-4"}],
+        },
+    ]
 
     with patch.object(client, "_make_request_with_retry", new_callable=AsyncMock) as mock_retry:
-        # Mock API response
-        mock_retry.return_value = {"data": {"month": month_data}}
+        # Month data and category groups are fetched concurrently, so route by URL
+        mock_retry.side_effect = _month_and_groups_responses(month_data, category_groups)
 
         result = await client.get_underfunded_goals("budget-123", "2025-10-01")
 
@@ -1227,7 +1672,6 @@ async def test_get_underfunded_goals(client):
         assert result["underfunded_categories"][1]["goal_type"] == "TBD"
 
 
-@pytest.mark.asyncio
 async def test_get_underfunded_goals_excludes_hidden_categories(client):
     """Test get_underfunded_goals excludes hidden categories."""
     # Mock month data with hidden and visible underfunded categories
@@ -1268,20 +1712,11 @@ async def test_get_underfunded_goals_excludes_hidden_categories(client):
     }
 
     # Mock category groups for mapping
-    mock_cat_1 = MagicMock()
-    mock_cat_1.id = "cat-1"
-
-    mock_group_1 = MagicMock()
-    mock_group_1.name = "Savings"
-    mock_group_1.categories = [mock_cat_1]
-
-    mock_response = MagicMock()
-    mock_response.data.category_groups = [mock_group_1]
-    client.client.categories.get_categories.return_value = mock_response
+    category_groups = [{"id": "group-1", "name": "Savings", "categories": [{"id": "cat-1"}]}]
 
     with patch.object(client, "_make_request_with_retry", new_callable=AsyncMock) as mock_retry:
-        # Mock API response
-        mock_retry.return_value = {"data": {"month": month_data}}
+        # Month data and category groups are fetched concurrently, so route by URL
+        mock_retry.side_effect = _month_and_groups_responses(month_data, category_groups)
 
         result = await client.get_underfunded_goals("budget-123", "2025-10-01")
 
@@ -1292,7 +1727,6 @@ async def test_get_underfunded_goals_excludes_hidden_categories(client):
         assert result["underfunded_categories"][0]["category_name"] == "Emergency Fund"
 
 
-@pytest.mark.asyncio
 async def test_get_underfunded_goals_no_underfunded_categories(client):
     """Test get_underfunded_goals when all categories are fully funded."""
     # Mock month data with no underfunded categories
@@ -1318,13 +1752,9 @@ async def test_get_underfunded_goals_no_underfunded_categories(client):
         ],
     }
 
-    mock_response = MagicMock()
-    mock_response.data.category_groups = []
-    client.client.categories.get_categories.return_value = mock_response
-
     with patch.object(client, "_make_request_with_retry", new_callable=AsyncMock) as mock_retry:
-        # Mock API response
-        mock_retry.return_value = {"data": {"month": month_data}}
+        # Month data and category groups are fetched concurrently, so route by URL
+        mock_retry.side_effect = _month_and_groups_responses(month_data, [])
 
         result = await client.get_underfunded_goals("budget-123", "2025-10-01")
 
@@ -1333,3 +1763,664 @@ async def test_get_underfunded_goals_no_underfunded_categories(client):
         assert result["total_underfunded"] == 0.0
         assert result["underfunded_count"] == 0
         assert len(result["underfunded_categories"]) == 0
+
+
+async def test_move_category_funds_rejects_same_category(client):
+    """Test moving funds within one category is rejected before any request."""
+    with (
+        patch.object(client, "_make_request_with_retry", new_callable=AsyncMock) as mock_retry,
+        pytest.raises(YNABValidationError, match="must be different"),
+    ):
+        await client.move_category_funds("budget-123", "2025-10-01", "cat-1", "cat-1", 10.0)
+
+    mock_retry.assert_not_called()
+
+
+async def test_move_category_funds_updates_both_categories(client):
+    """Test move_category_funds PATCHes the source and destination categories."""
+    month_categories = {
+        "cat-from": {"id": "cat-from", "name": "Dining Out", "budgeted": 100000},
+        "cat-to": {"id": "cat-to", "name": "Groceries", "budgeted": 20000},
+    }
+
+    async def fake_request(method, url, **kwargs):
+        if method == "get":
+            return {"data": {"category": month_categories[url.rsplit("/", 1)[1]]}}
+        category_id = url.rsplit("/", 1)[1]
+        budgeted = kwargs["json"]["category"]["budgeted"]
+        return {
+            "data": {
+                "category": {
+                    "id": category_id,
+                    "name": category_id,
+                    "budgeted": budgeted,
+                    "balance": budgeted,
+                }
+            }
+        }
+
+    with patch.object(client, "_make_request_with_retry", side_effect=fake_request) as mock_retry:
+        result = await client.move_category_funds(
+            "budget-123", "2025-10-01", "cat-from", "cat-to", 25.0
+        )
+
+    gets = [call.args[1] for call in mock_retry.call_args_list if call.args[0] == "get"]
+    assert sorted(gets) == [
+        "https://api.ynab.com/v1/budgets/budget-123/months/2025-10-01/categories/cat-from",
+        "https://api.ynab.com/v1/budgets/budget-123/months/2025-10-01/categories/cat-to",
+    ]
+    patches = [call for call in mock_retry.call_args_list if call.args[0] == "patch"]
+    assert len(patches) == 2
+    sent = {call.args[1].rsplit("/", 1)[1]: call.kwargs["json"] for call in patches}
+    assert sent["cat-from"] == {"category": {"budgeted": 75000}}
+    assert sent["cat-to"] == {"category": {"budgeted": 45000}}
+    assert result["from_category"]["budgeted"] == 75.0
+    assert result["to_category"]["budgeted"] == 45.0
+    assert result["amount_moved"] == 25.0
+
+
+async def test_bulk_update_category_budgets_reports_per_category_errors(client):
+    """Test bulk budget updates run concurrently and report failures per category."""
+
+    async def fake_request(method, url, **kwargs):
+        category_id = url.rsplit("/", 1)[1]
+        if category_id == "cat-2":
+            raise YNABAPIError("API request failed: HTTP 404", status_code=404)
+        budgeted = kwargs["json"]["category"]["budgeted"]
+        return {
+            "data": {
+                "category": {
+                    "id": category_id,
+                    "name": category_id,
+                    "budgeted": budgeted,
+                    "activity": 0,
+                    "balance": budgeted,
+                }
+            }
+        }
+
+    with patch.object(client, "_make_request_with_retry", side_effect=fake_request) as mock_retry:
+        result = await client.bulk_update_category_budgets(
+            "budget-123", "2025-10-01", {"cat-1": 250.0, "cat-2": 10.0, "cat-3": 75.5}
+        )
+
+    assert mock_retry.call_count == 3
+    assert [c["id"] for c in result["categories"]] == ["cat-1", "cat-3"]
+    assert result["categories"][1]["budgeted"] == 75.5
+    assert result["count"] == 2
+    assert result["errors"][0]["category_id"] == "cat-2"
+    assert "HTTP 404" in result["errors"][0]["error"]
+
+
+async def test_move_category_funds_reverts_when_one_update_fails(client):
+    """Test a failed half of a fund move rolls back the half that succeeded."""
+    month_categories = {
+        "cat-from": {"id": "cat-from", "name": "Dining Out", "budgeted": 100000},
+        "cat-to": {"id": "cat-to", "name": "Groceries", "budgeted": 20000},
+    }
+
+    async def fake_request(method, url, **kwargs):
+        if method == "get":
+            return {"data": {"category": month_categories[url.rsplit("/", 1)[1]]}}
+        if url.endswith("cat-from"):
+            raise YNABAPIError("API request failed: HTTP 500", status_code=500)
+        budgeted = kwargs["json"]["category"]["budgeted"]
+        return {"data": {"category": {"id": "cat-to", "name": "Groceries", "budgeted": budgeted}}}
+
+    with (
+        patch.object(client, "_make_request_with_retry", side_effect=fake_request) as mock_retry,
+        pytest.raises(Exception, match="cat-to was reverted"),
+    ):
+        await client.move_category_funds("budget-123", "2025-10-01", "cat-from", "cat-to", 25.0)
+
+    to_patches = [
+        call.kwargs["json"]
+        for call in mock_retry.call_args_list
+        if call.args[0] == "patch" and call.args[1].endswith("cat-to")
+    ]
+    # Forward update, then the revert to the original budgeted amount
+    assert to_patches == [{"category": {"budgeted": 45000}}, {"category": {"budgeted": 20000}}]
+
+
+async def test_category_groups_refresh_with_server_knowledge_delta(client):
+    """Test later category reads request only changes and merge them by id."""
+    full = {
+        "data": {
+            "server_knowledge": 10,
+            "category_groups": [
+                {
+                    "id": "group-1",
+                    "name": "Everyday",
+                    "categories": [
+                        {"id": "cat-1", "name": "Groceries", "budgeted": 50000},
+                        {"id": "cat-2", "name": "Dining Out", "budgeted": 20000},
+                    ],
+                }
+            ],
+        }
+    }
+    delta = {
+        "data": {
+            "server_knowledge": 12,
+            "category_groups": [
+                {
+                    "id": "group-1",
+                    "name": "Everyday",
+                    "categories": [{"id": "cat-2", "name": "Dining Out", "budgeted": 35000}],
+                }
+            ],
+        }
+    }
+
+    with patch.object(
+        client, "_make_request_with_retry", new_callable=AsyncMock, side_effect=[full, delta]
+    ) as mock_retry:
+        await client._get_category_groups("budget-123")
+        client._invalidate_cache("budget-123")
+        groups = await client._get_category_groups("budget-123")
+
+    assert "params" not in mock_retry.call_args_list[0].kwargs
+    assert mock_retry.call_args_list[1].kwargs["params"] == {"last_knowledge_of_server": 10}
+    assert [(c["id"], c["budgeted"]) for c in groups[0]["categories"]] == [
+        ("cat-1", 50000),
+        ("cat-2", 35000),
+    ]
+    assert client._category_snapshots["budget-123"][0] == 12
+
+
+async def test_get_categories_drops_categories_deleted_in_a_delta(client):
+    """Test deletions from a delta response disappear even with include_hidden=True."""
+    full = {
+        "data": {
+            "server_knowledge": 10,
+            "category_groups": [
+                {
+                    "id": "group-1",
+                    "name": "Everyday",
+                    "categories": [
+                        {"id": "cat-1", "name": "Groceries", "balance": 0},
+                        {"id": "cat-2", "name": "Dining Out", "balance": 0},
+                    ],
+                },
+                {"id": "group-2", "name": "Old", "categories": [{"id": "cat-3", "name": "X"}]},
+            ],
+        }
+    }
+    delta = {
+        "data": {
+            "server_knowledge": 12,
+            "category_groups": [
+                {
+                    "id": "group-1",
+                    "name": "Everyday",
+                    "categories": [{"id": "cat-2", "name": "Dining Out", "deleted": True}],
+                },
+                {"id": "group-2", "name": "Old", "deleted": True, "categories": []},
+            ],
+        }
+    }
+
+    with patch.object(
+        client, "_make_request_with_retry", new_callable=AsyncMock, side_effect=[full, delta]
+    ):
+        await client.get_categories("budget-123", include_hidden=True)
+        client._invalidate_cache("budget-123")
+        result = await client.get_categories("budget-123", include_hidden=True)
+        names = await client._get_category_group_names("budget-123")
+
+    assert [group["id"] for group in result] == ["group-1"]
+    assert [category["id"] for category in result[0]["categories"]] == ["cat-1"]
+    assert names == {"cat-1": "Everyday"}
+
+
+async def test_category_groups_reused_within_ttl_until_a_write(client):
+    """Test category snapshots skip the request while fresh and refresh after a write."""
+    response = {"data": {"server_knowledge": 10, "category_groups": []}}
+
+    with patch.object(
+        client, "_make_request_with_retry", new_callable=AsyncMock, return_value=response
+    ) as mock_retry:
+        await client._get_category_groups("budget-123")
+        await client._get_category_groups("budget-123")
+        assert mock_retry.call_count == 1
+
+        client._invalidate_cache("budget-123")
+        await client._get_category_groups("budget-123")
+
+    assert mock_retry.call_count == 2
+    assert mock_retry.call_args.kwargs["params"] == {"last_knowledge_of_server": 10}
+
+
+async def test_category_group_names_rebuilt_only_when_snapshot_changes(client):
+    """Test the category-to-group map is memoized until a delta changes the snapshot."""
+    full = {
+        "data": {
+            "server_knowledge": 10,
+            "category_groups": [
+                {"id": "group-1", "name": "Bills", "categories": [{"id": "cat-1", "name": "Rent"}]}
+            ],
+        }
+    }
+    unchanged = {"data": {"server_knowledge": 10, "category_groups": []}}
+    renamed = {
+        "data": {
+            "server_knowledge": 11,
+            "category_groups": [{"id": "group-1", "name": "Housing", "categories": []}],
+        }
+    }
+
+    with patch.object(
+        client,
+        "_make_request_with_retry",
+        new_callable=AsyncMock,
+        side_effect=[full, unchanged, renamed],
+    ):
+        first = await client._get_category_group_names("budget-123")
+        client._invalidate_cache("budget-123")
+        second = await client._get_category_group_names("budget-123")
+        client._invalidate_cache("budget-123")
+        third = await client._get_category_group_names("budget-123")
+
+    assert first == {"cat-1": "Bills"}
+    assert second is first
+    assert third == {"cat-1": "Housing"}
+
+
+async def test_get_budget_summary_totals_visible_categories(client):
+    """Test the budget summary skips hidden/deleted categories and sums the rest."""
+    month_response = {
+        "data": {
+            "month": {
+                "month": "2025-10-01",
+                "income": 500000,
+                "to_be_budgeted": 0,
+                "categories": [
+                    {
+                        "id": "cat-1",
+                        "name": "Groceries",
+                        "budgeted": 100100,
+                        "activity": -50050,
+                        "balance": 50050,
+                        "hidden": False,
+                        "deleted": False,
+                    },
+                    {
+                        "id": "cat-2",
+                        "name": "Rent",
+                        "budgeted": 200200,
+                        "activity": -200200,
+                        "balance": 0,
+                        "hidden": False,
+                        "deleted": False,
+                    },
+                    {
+                        "id": "cat-3",
+                        "name": "Old",
+                        "budgeted": 9000,
+                        "activity": 0,
+                        "balance": 9000,
+                        "hidden": True,
+                        "deleted": False,
+                    },
+                ],
+            }
+        }
+    }
+    groups_response = {
+        "data": {
+            "category_groups": [
+                {"id": "group-1", "name": "Everyday", "categories": [{"id": "cat-1"}]},
+                {"id": "group-2", "name": "Bills", "categories": [{"id": "cat-2"}]},
+            ]
+        }
+    }
+
+    with patch.object(
+        client,
+        "_make_request_with_retry",
+        new_callable=AsyncMock,
+        side_effect=_month_and_groups_responses(
+            month_response["data"]["month"], groups_response["data"]["category_groups"]
+        ),
+    ):
+        summary = await client.get_budget_summary("budget-123", "2025-10-01")
+
+    assert summary["budgeted"] == 300.3
+    assert summary["activity"] == -250.25
+    assert summary["balance"] == 50.05
+    assert summary["income"] == 500
+    assert [(c["category_group"], c["category_name"]) for c in summary["categories"]] == [
+        ("Everyday", "Groceries"),
+        ("Bills", "Rent"),
+    ]
+
+
+async def test_get_budget_summary_without_group_names_skips_categories_request(client):
+    """Test include_group_names=False fetches only the month."""
+    month = {
+        "month": "2025-10-01",
+        "income": 0,
+        "to_be_budgeted": 0,
+        "categories": [
+            {"id": "cat-1", "name": "Groceries", "budgeted": 1000, "activity": 0, "balance": 1000}
+        ],
+    }
+
+    with patch.object(client, "_make_request_with_retry", new_callable=AsyncMock) as mock_retry:
+        mock_retry.return_value = {"data": {"month": month}}
+        summary = await client.get_budget_summary(
+            "budget-123", "2025-10-01", include_group_names=False
+        )
+
+    mock_retry.assert_called_once()
+    assert mock_retry.call_args.args[1].endswith("/months/2025-10-01")
+    assert summary["budgeted"] == 1.0
+    assert summary["categories"][0]["category_group"] is None
+
+
+async def test_refresh_all_fetches_reads_concurrently(client):
+    """Test refresh_all issues its three reads together and combines the results."""
+    started = []
+    all_started = asyncio.Event()
+
+    def fake_read(name, value):
+        async def read(*args, **kwargs):
+            started.append(name)
+            if len(started) == 3:
+                all_started.set()
+            # Only completes if the other reads were started without waiting on this one
+            await all_started.wait()
+            return value
+
+        return read
+
+    with (
+        patch.object(client, "get_budgets", new=fake_read("budgets", ["b"])),
+        patch.object(client, "get_categories", new=fake_read("categories", ["c"])),
+        patch.object(
+            client, "get_transactions", new=fake_read("transactions", {"transactions": []})
+        ),
+    ):
+        result = await asyncio.wait_for(client.refresh_all("budget-123"), timeout=1)
+
+    assert sorted(started) == ["budgets", "categories", "transactions"]
+    assert result == {
+        "budgets": ["b"],
+        "categories": ["c"],
+        "transactions": {"transactions": []},
+    }
+
+
+@pytest.mark.parametrize("month", ["2025-10-01", "2025-10-15"])
+async def test_get_month_dashboard_combines_summary_and_month_transactions(client, month):
+    """Test get_month_dashboard adds the whole month's transactions to the summary."""
+    summary = {"month": "2025-10-01", "categories": []}
+    transactions = [
+        {"id": "txn-1", "date": "2025-10-05", "amount": -12340, "payee_name": "Store"},
+        {"id": "txn-2", "date": "2025-11-02", "amount": -5000, "payee_name": "Cafe"},
+    ]
+
+    with (
+        patch.object(client, "get_budget_summary", new_callable=AsyncMock) as mock_summary,
+        patch.object(client, "_make_request_with_retry", new_callable=AsyncMock) as mock_retry,
+    ):
+        mock_summary.return_value = summary
+        mock_retry.return_value = {"data": {"server_knowledge": 5, "transactions": transactions}}
+        result = await client.get_month_dashboard("budget-123", month)
+
+    # A mid-month date still covers the month from its first day
+    mock_summary.assert_awaited_once_with("budget-123", "2025-10-01")
+    assert mock_retry.call_args.kwargs["params"] == {"since_date": "2025-10-01"}
+    assert result["month"] == "2025-10-01"
+    assert [txn["id"] for txn in result["transactions"]] == ["txn-1"]
+    assert result["transactions"][0]["amount"] == -12.34
+    # The dashboard read leaves the delta-sync snapshots alone
+    assert not client._transaction_snapshots
+
+
+async def test_get_unapproved_transactions_filters_server_side(client):
+    """Test unapproved transactions are requested with type=unapproved."""
+    response = {
+        "data": {
+            "transactions": [
+                {"id": "txn-1", "date": "2025-10-01", "amount": -12340, "deleted": False},
+                {"id": "txn-2", "date": "2025-10-02", "amount": -5000, "deleted": True},
+            ]
+        }
+    }
+
+    with patch.object(
+        client, "_make_request_with_retry", new_callable=AsyncMock, return_value=response
+    ) as mock_retry:
+        transactions = await client.get_unapproved_transactions("budget-123")
+
+    assert mock_retry.call_args.kwargs["params"] == {"type": "unapproved"}
+    assert [(t["id"], t["amount"]) for t in transactions] == [("txn-1", -12.34)]
+
+
+async def test_update_transaction_sends_only_provided_fields(client):
+    """Test updating a transaction is a single request carrying only the changed fields."""
+    response = {
+        "data": {
+            "transaction": {"id": "txn-1", "date": "2025-10-01", "amount": -25500, "memo": "Lunch"}
+        }
+    }
+
+    with patch.object(
+        client, "_make_request_with_retry", new_callable=AsyncMock, return_value=response
+    ) as mock_retry:
+        result = await client.update_transaction("budget-123", "txn-1", amount=-25.5, memo="Lunch")
+
+    mock_retry.assert_awaited_once()
+    method, url = mock_retry.call_args.args
+    assert method == "put"
+    assert url.endswith("/budgets/budget-123/transactions/txn-1")
+    assert mock_retry.call_args.kwargs["json"] == {
+        "transaction": {"amount": -25500, "memo": "Lunch"}
+    }
+    assert result["amount"] == -25.5
+
+
+async def test_create_transactions_posts_one_bulk_request(client):
+    """Test several transactions are created with a single bulk POST."""
+    response = {
+        "data": {
+            "transaction_ids": ["txn-1", "txn-2"],
+            "transactions": [
+                {"id": "txn-1", "date": "2025-10-01", "amount": -12500, "memo": "Coffee"},
+                {"id": "txn-2", "date": "2025-10-02", "amount": 100000},
+            ],
+            "duplicate_import_ids": [],
+        }
+    }
+
+    with patch.object(
+        client, "_make_request_with_retry", new_callable=AsyncMock, return_value=response
+    ) as mock_retry:
+        result = await client.create_transactions(
+            "budget-123",
+            [
+                {"account_id": "acct-1", "date": "2025-10-01", "amount": -12.5, "memo": "Coffee"},
+                {"account_id": "acct-1", "date": "2025-10-02", "amount": 100, "cleared": "cleared"},
+            ],
+        )
+
+    mock_retry.assert_awaited_once()
+    assert mock_retry.call_args.args[0] == "post"
+    assert mock_retry.call_args.kwargs["json"] == {
+        "transactions": [
+            {
+                "account_id": "acct-1",
+                "date": "2025-10-01",
+                "amount": -12500,
+                "cleared": "uncleared",
+                "approved": False,
+                "memo": "Coffee",
+            },
+            {
+                "account_id": "acct-1",
+                "date": "2025-10-02",
+                "amount": 100000,
+                "cleared": "cleared",
+                "approved": False,
+            },
+        ]
+    }
+    assert result["count"] == 2
+    assert [t["amount"] for t in result["transactions"]] == [-12.5, 100]
+
+
+async def test_create_transaction_rounds_amount_to_milliunits(client):
+    """Test amounts that aren't exact in floating point still convert to the right milliunits."""
+    response = {"data": {"transactions": [{"id": "txn-1", "date": "2025-10-01", "amount": -64100}]}}
+
+    with patch.object(
+        client, "_make_request_with_retry", new_callable=AsyncMock, return_value=response
+    ) as mock_retry:
+        await client.create_transaction("budget-123", "acct-1", "2025-10-01", -64.1)
+
+    assert mock_retry.call_args.kwargs["json"]["transactions"][0]["amount"] == -64100
+
+
+async def test_bulk_update_transactions_sends_one_sparse_patch(client):
+    """Test bulk updates go out as one PATCH carrying only the given fields."""
+    with patch.object(client, "_make_request_with_retry", new_callable=AsyncMock) as mock_retry:
+        mock_retry.return_value = {
+            "data": {
+                "transaction_ids": ["txn-1", "txn-2"],
+                "transactions": [
+                    {"id": "txn-1", "amount": -5000, "approved": True},
+                    {"id": "txn-2", "amount": -12500, "category_id": "cat-1"},
+                ],
+            }
+        }
+
+        result = await client.bulk_update_transactions(
+            "budget-123",
+            [
+                {"id": "txn-1", "approved": True},
+                {"id": "txn-2", "category_id": "cat-1", "amount": -12.5, "memo": None},
+            ],
+        )
+
+    mock_retry.assert_called_once()
+    assert mock_retry.call_args.args[0] == "patch"
+    assert mock_retry.call_args.args[1].endswith("/budgets/budget-123/transactions")
+    assert mock_retry.call_args.kwargs["json"] == {
+        "transactions": [
+            {"id": "txn-1", "approved": True},
+            {"id": "txn-2", "amount": -12500, "category_id": "cat-1"},
+        ]
+    }
+    assert result["count"] == 2
+    assert result["transactions"][1]["amount"] == -12.5
+
+
+@pytest.mark.parametrize("amount", ["5", True])
+async def test_bulk_update_transactions_rejects_non_numeric_amount(client, amount):
+    """Test a non-numeric amount is a validation error, not a failed API call."""
+    with (
+        patch.object(client, "_make_request_with_retry", new_callable=AsyncMock) as mock_retry,
+        pytest.raises(YNABValidationError, match="Update 0 amount must be a number"),
+    ):
+        await client.bulk_update_transactions("budget-123", [{"id": "txn-1", "amount": amount}])
+
+    mock_retry.assert_not_called()
+
+
+async def test_create_transactions_requires_core_fields(client):
+    """Test bulk creation rejects transactions missing required fields."""
+    with pytest.raises(
+        YNABValidationError, match="Transaction 1 is missing required fields: amount"
+    ):
+        await client.create_transactions(
+            "budget-123",
+            [
+                {"account_id": "acct-1", "date": "2025-10-01", "amount": -1},
+                {"account_id": "acct-1", "date": "2025-10-02"},
+            ],
+        )
+
+
+async def test_create_transactions_rejects_non_numeric_amount(client):
+    """Test a string amount is rejected before the bulk request is sent."""
+    with (
+        patch.object(client, "_make_request_with_retry", new_callable=AsyncMock) as mock_retry,
+        pytest.raises(YNABValidationError, match="Transaction 0 amount must be a number"),
+    ):
+        await client.create_transactions(
+            "budget-123", [{"account_id": "acct-1", "date": "2025-10-01", "amount": "5"}]
+        )
+
+    mock_retry.assert_not_called()
+
+
+async def test_transaction_snapshot_survives_a_failed_delta_read(client):
+    """Test a failed delta read keeps the snapshot and its most-recently-used position."""
+    full = {
+        "data": {
+            "server_knowledge": 100,
+            "transactions": [{"id": "txn-1", "date": "2025-10-01", "amount": -10000}],
+        }
+    }
+    other = {"data": {"server_knowledge": 7, "transactions": []}}
+    delta = {"data": {"server_knowledge": 101, "transactions": []}}
+    url = "https://api.ynab.com/v1/budgets/budget-123/transactions"
+    other_url = "https://api.ynab.com/v1/budgets/budget-456/transactions"
+
+    with patch.object(
+        client,
+        "_make_request_with_retry",
+        new_callable=AsyncMock,
+        side_effect=[full, other, YNABConnectionError("timed out"), delta],
+    ) as mock_retry:
+        await client._get_transaction_rows(url)
+        await client._get_transaction_rows(other_url)
+        with pytest.raises(YNABConnectionError):
+            await client._get_transaction_rows(url)
+        rows = await client._get_transaction_rows(url)
+
+    assert mock_retry.call_args_list[3].kwargs["params"] == {"last_knowledge_of_server": 100}
+    assert [txn["id"] for txn in rows] == ["txn-1"]
+    # The listing just read is now the most recently used, so it is evicted last
+    assert list(client._transaction_snapshots) == [(other_url, None), (url, None)]
+
+
+async def test_transactions_refresh_with_server_knowledge_delta(client):
+    """Test repeated transaction reads merge deltas into the previous listing."""
+    full = {
+        "data": {
+            "server_knowledge": 100,
+            "transactions": [
+                {"id": "txn-1", "date": "2025-10-01", "amount": -10000},
+                {"id": "txn-2", "date": "2025-10-03", "amount": -20000},
+                {"id": "txn-3", "date": "2025-10-05", "amount": -30000},
+            ],
+        }
+    }
+    delta = {
+        "data": {
+            "server_knowledge": 104,
+            "transactions": [
+                {"id": "txn-2", "date": "2025-10-03", "amount": -25000},
+                {"id": "txn-3", "date": "2025-10-05", "amount": -30000, "deleted": True},
+                {"id": "txn-4", "date": "2025-10-02", "amount": -40000},
+            ],
+        }
+    }
+
+    with patch.object(
+        client, "_make_request_with_retry", new_callable=AsyncMock, side_effect=[full, delta]
+    ) as mock_retry:
+        await client.get_transactions("budget-123", since_date="2025-10-01")
+        result = await client.get_transactions("budget-123", since_date="2025-10-01")
+
+    assert mock_retry.call_args_list[1].kwargs["params"] == {
+        "since_date": "2025-10-01",
+        "last_knowledge_of_server": 100,
+    }
+    assert [(t["id"], t["amount"]) for t in result["transactions"]] == [
+        ("txn-1", -10.0),
+        ("txn-4", -40.0),
+        ("txn-2", -25.0),
+    ]
@@ -0,0 +1,23 @@
+"""Tests for YNAB client construction."""
+
+from __future__ import annotations
+
+import pytest
+
+from src.ynab_mcp.exceptions import YNABValidationError
+from src.ynab_mcp.ynab_client import YNABClient
+
+
+def test_client_initialization():
+    """Test client initializes with access token."""
+    client = YNABClient("test_token")
+    assert client._access_token == "test_token"
+    assert client.api_base_url == "https://api.ynab.com/v1"
+
+
+def test_client_initialization_fails_without_token():
+    """Test client raises error without access token."""
+    with pytest.raises(
+        YNABValidationError, match="YNAB_ACCESS_TOKEN environment variable must be set"
+    ):
+        YNABClient(None)